@@ -0,0 +1,340 @@
+# FILE: QuickScrub/api/compression.py
+
+"""ASGI middleware for compressed request and response bodies.
+
+Requests sent with ``Content-Encoding: gzip`` or ``zstd`` are decoded
+incrementally as each chunk of the body arrives, in bounded pieces, and are
+rejected with ``413`` as soon as the decompressed size exceeds the configured
+limit, so a small "zip bomb" can never expand into a huge allocation.
+Responses are compressed with the best encoding the client lists in
+``Accept-Encoding``.
+
+zstd support requires the optional ``zstandard`` package
+(``pip install "QuickScrub[fast]"``); gzip is always available.
+"""
+
+import json
+import zlib
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+DECODE_ERRORS = (zlib.error, EOFError, ValueError)
+if zstandard is not None:
+    DECODE_ERRORS += (zstandard.ZstdError,)
+
+# Bytes read from the decoder at a time; bounds the memory used per step.
+CHUNK_SIZE = 64 * 1024
+
+
+class BodyTooLarge(Exception):
+    pass
+
+
+# Decoders are fed the compressed body chunk by chunk and pass the output to
+# `emit` in pieces of at most CHUNK_SIZE bytes, so `emit` can abort decoding
+# (by raising) as soon as the output grows too large.
+class _GzipDecoder:
+    def __init__(self, emit: Callable[[bytes], None]):
+        self.emit = emit
+        self._decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def feed(self, data: bytes):
+        while data:
+            self.emit(self._decoder.decompress(data, CHUNK_SIZE))
+            if self._decoder.eof:
+                # Concatenated gzip members (`cat a.gz b.gz`) are one valid body.
+                data = self._decoder.unused_data
+                if data:
+                    self._decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            else:
+                data = self._decoder.unconsumed_tail
+
+    def finish(self):
+        self.emit(self._decoder.flush())
+        if not self._decoder.eof:
+            raise EOFError("gzip stream is truncated")
+
+
+class _ZstdFrameTracker:
+    """
+    Follows zstd frame and block headers, without decoding anything, to tell
+    whether the input stopped exactly at the end of a frame. The stream writer
+    that does the decoding silently accepts a truncated frame.
+    """
+    def __init__(self):
+        self.frames = 0
+        self._pending = b""
+        self._skip = 0
+        self._in_frame = False
+        self._checksum_size = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.frames > 0 and not self._in_frame and not self._skip and not self._pending
+
+    def feed(self, data: bytes):
+        data = self._pending + data
+        pos = 0
+        while True:
+            step = min(self._skip, len(data) - pos)
+            self._skip -= step
+            pos += step
+            if self._skip:
+                break
+            consumed = self._parse_header(data, pos)
+            if not consumed:
+                break
+            pos += consumed
+        self._pending = data[pos:]
+
+    def _parse_header(self, data: bytes, pos: int) -> int:
+        # Returns the size of the header at `pos`, or 0 if it is not complete yet.
+        available = len(data) - pos
+        if self._in_frame:
+            if available < 3:
+                return 0
+            header = int.from_bytes(data[pos:pos + 3], "little")
+            # RLE blocks (type 1) carry a single byte; the others carry `size` bytes.
+            self._skip = 1 if (header >> 1) & 3 == 1 else header >> 3
+            if header & 1:
+                self._in_frame = False
+                self._skip += self._checksum_size
+            return 3
+        if available < 8:
+            return 0
+        magic = int.from_bytes(data[pos:pos + 4], "little")
+        if magic & 0xFFFFFFF0 == 0x184D2A50:
+            # Skippable frame: a 4-byte length followed by opaque data.
+            self._skip = int.from_bytes(data[pos + 4:pos + 8], "little")
+            return 8
+        descriptor = data[pos + 4]
+        single_segment = descriptor & 0x20
+        size = (5 + (0 if single_segment else 1) + (0, 1, 2, 4)[descriptor & 3]
+                + (1 if single_segment else 0, 2, 4, 8)[descriptor >> 6])
+        if available < size:
+            return 0
+        self.frames += 1
+        self._in_frame = True
+        self._checksum_size = 4 if descriptor & 4 else 0
+        return size
+
+
+class _ZstdDecoder:
+    def __init__(self, emit: Callable[[bytes], None]):
+        self.emit = emit
+        self._writer = zstandard.ZstdDecompressor().stream_writer(self, write_size=CHUNK_SIZE)
+        self._frames = _ZstdFrameTracker()
+
+    def write(self, data: bytes) -> int:
+        # Called by the zstandard stream writer with each decompressed piece.
+        self.emit(data)
+        return len(data)
+
+    def feed(self, data: bytes):
+        self._writer.write(data)
+        self._frames.feed(data)
+
+    def finish(self):
+        self._writer.flush()
+        if not self._frames.complete:
+            raise EOFError("zstd stream is truncated")
+
+
+def _supported_decoders():
+    decoders = {"gzip": _GzipDecoder}
+    if zstandard is not None:
+        decoders["zstd"] = _ZstdDecoder
+    return decoders
+
+
+def _parse_accept_encoding(header: str) -> List[str]:
+    """Returns the accepted codings, ignoring any with an explicit q=0."""
+    accepted = []
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.append(coding.strip().lower())
+    return accepted
+
+
+class CompressionMiddleware:
+    """Decodes compressed request bodies and compresses responses."""
+
+    def __init__(self, app, max_body_size: int = 64 * 1024 * 1024, minimum_size: int = 1024,
+                 gzip_level: int = 6, zstd_level: int = 3):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+        self.decoders = _supported_decoders()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        content_encoding = headers.get(b"content-encoding", b"").decode("latin-1").strip().lower()
+        if content_encoding and content_encoding != "identity":
+            decoder_class = self.decoders.get(content_encoding)
+            if decoder_class is None:
+                await self._send_error(send, 415, f"Unsupported Content-Encoding '{content_encoding}'.")
+                return
+            try:
+                body = await self._decode_body(receive, decoder_class)
+            except BodyTooLarge:
+                await self._send_error(send, 413, "Decompressed request body is too large.")
+                return
+            except DECODE_ERRORS as e:
+                await self._send_error(send, 400, f"Could not decode request body: {e}")
+                return
+            scope = dict(scope)
+            scope["headers"] = [
+                (name, value) for name, value in scope["headers"]
+                if name not in (b"content-encoding", b"content-length")
+            ] + [(b"content-length", str(len(body)).encode("latin-1"))]
+            receive = self._replay(body, receive)
+
+        encoding = self._negotiate(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+        else:
+            await self.app(scope, receive, _CompressingSender(send, encoding, self))
+
+    async def _decode_body(self, receive, decoder_class: Callable) -> bytes:
+        # Decode each chunk as it arrives, stopping as soon as either the
+        # compressed or the decompressed size crosses the limit.
+        output: List[bytes] = []
+        size = 0
+
+        def emit(piece: bytes):
+            nonlocal size
+            size += len(piece)
+            if size > self.max_body_size:
+                raise BodyTooLarge()
+            output.append(piece)
+
+        decoder = decoder_class(emit)
+        compressed_size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            compressed_size += len(chunk)
+            if compressed_size > self.max_body_size:
+                raise BodyTooLarge()
+            decoder.feed(chunk)
+            more_body = message.get("more_body", False)
+        decoder.finish()
+        return b"".join(output)
+
+    @staticmethod
+    def _replay(body: bytes, receive):
+        sent = False
+
+        async def replay_receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+        return replay_receive
+
+    def _negotiate(self, accept_encoding: str) -> Optional[str]:
+        accepted = _parse_accept_encoding(accept_encoding)
+        if "zstd" in accepted and zstandard is not None:
+            return "zstd"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    @staticmethod
+    async def _send_error(send, status: int, detail: str):
+        body = json.dumps({"detail": detail}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode("latin-1"))],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class _CompressingSender:
+    """Wraps the ASGI `send` callable to compress the response body."""
+
+    def __init__(self, send, encoding: str, middleware: CompressionMiddleware):
+        self.send = send
+        self.encoding = encoding
+        self.middleware = middleware
+        self.start_message: Optional[dict] = None
+        self.compressor = None
+        self.passthrough = False
+
+    def _new_compressor(self) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        if self.encoding == "zstd":
+            compressor = zstandard.ZstdCompressor(level=self.middleware.zstd_level).compressobj()
+        else:
+            compressor = zlib.compressobj(self.middleware.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress, compressor.flush
+
+    def _compressed_headers(self, content_length: Optional[int]) -> List[Tuple[bytes, bytes]]:
+        headers = [(name, value) for name, value in self.start_message["headers"]
+                   if name.lower() != b"content-length"]
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        headers.append((b"vary", b"Accept-Encoding"))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode("latin-1")))
+        return headers
+
+    async def __call__(self, message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            already_encoded = any(name.lower() == b"content-encoding" for name, _ in message.get("headers", []))
+            self.passthrough = already_encoded
+            if already_encoded:
+                await self.send(message)
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            if not more_body:
+                # Whole body in one message: compress it in one shot, if worthwhile.
+                if len(body) < self.middleware.minimum_size:
+                    await self.send(self.start_message)
+                    await self.send(message)
+                    return
+                compress, flush = self._new_compressor()
+                compressed = compress(body) + flush()
+                await self.send({**self.start_message, "headers": self._compressed_headers(len(compressed))})
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            # Streaming response: compress each chunk as it arrives.
+            self.compressor = self._new_compressor()
+            await self.send({**self.start_message, "headers": self._compressed_headers(None)})
+
+        compress, flush = self.compressor
+        data = compress(body)
+        if not more_body:
+            data += flush()
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends
-from ..models.data_models import ScrubRequest, ScrubResponse, LegendItem, ScrubTask
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+from ..models.data_models import (
+    ScrubRequest, ScrubResponse, ScrubTask, ScrubFormat, DetectRequest, DetectResponse, CountResponse
+)
 from ..core.engine import ScrubberEngine
 from ..core.registry import RecognizerRegistry
+from ..core.structured import StructuredScrubber, split_lines
+from .responses import FastJSONResponse
 
 router = APIRouter()
 
@@ -13,17 +18,57 @@ REGISTRY_INSTANCE = RecognizerRegistry()
 def get_engine() -> ScrubberEngine: return ENGINE_INSTANCE
 def get_registry() -> RecognizerRegistry: return REGISTRY_INSTANCE
 
-# --- API Endpoint ---
-@router.post("/scrub", response_model=ScrubResponse)
+# --- API Endpoints ---
+@router.get("/ready")
+async def readiness(registry: RecognizerRegistry = Depends(get_registry)):
+    """Reports whether recognizers are loaded and warmed up."""
+    if not registry.ready:
+        return JSONResponse(status_code=503, content={"ready": False})
+    return {"ready": True}
+
+# Responses are built as plain dicts and rendered directly, which skips
+# re-validating every legend item through the response model.
+@router.post("/scrub", response_model=ScrubResponse, response_class=FastJSONResponse)
 async def scrub_text(
     request: ScrubRequest,
     engine: ScrubberEngine = Depends(get_engine),
     registry: RecognizerRegistry = Depends(get_registry)
 ):
+    if request.format != ScrubFormat.TEXT:
+        scrubber = StructuredScrubber(engine, registry, request.types, request.allow_list, request.fields)
+        try:
+            scrubbed_text = "".join(scrubber.iter_scrubbed(request.format, split_lines(request.text)))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return FastJSONResponse({"scrubbed_text": scrubbed_text, "legend": scrubber.legend()})
+
     task = ScrubTask(text=request.text, types=request.types, allow_list=request.allow_list or [])
     all_findings = registry.get_findings(task.text, task.types)
     result = engine.scrub(task, all_findings)
-    return ScrubResponse(
-        scrubbed_text=result.scrubbed_text,
-        legend=[LegendItem(**item) for item in result.legend]
-    )
+    return FastJSONResponse({"scrubbed_text": result.scrubbed_text, "legend": result.legend})
+
+
+# --- Detect-only Endpoints ---
+# These never rewrite the text or build a legend, and stop scanning as soon as
+# `limit`/`first` are satisfied.
+@router.post("/detect", response_model=DetectResponse, response_class=FastJSONResponse)
+async def detect_pii(
+    request: DetectRequest,
+    engine: ScrubberEngine = Depends(get_engine),
+    registry: RecognizerRegistry = Depends(get_registry)
+):
+    task = ScrubTask(text=request.text, types=request.types, allow_list=request.allow_list or [])
+    findings = registry.findings_by_type(task.text, task.types, task.allow_list)
+    detected = engine.detect(task, findings, first=request.first, limit=request.limit)
+    return FastJSONResponse({"findings": [finding.to_dict() for finding in detected]})
+
+@router.post("/count", response_model=CountResponse, response_class=FastJSONResponse)
+async def count_pii(
+    request: DetectRequest,
+    engine: ScrubberEngine = Depends(get_engine),
+    registry: RecognizerRegistry = Depends(get_registry)
+):
+    task = ScrubTask(text=request.text, types=request.types, allow_list=request.allow_list or [])
+    findings = registry.findings_by_type(task.text, task.types, task.allow_list)
+    counts = engine.count(task, findings, first=request.first, limit=request.limit)
+    return FastJSONResponse({"counts": counts, "total": sum(counts.values())})
@@ -0,0 +1,21 @@
+# FILE: QuickScrub/api/responses.py
+
+from typing import Any
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    A JSON response rendered with orjson when it is installed, which is several
+    times faster than the standard library for large scrubbed documents.
+    Falls back to the default encoder otherwise.
+    """
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
@@ -1,15 +1,17 @@
 # FILE: QuickScrub/cli.py
 
 import sys
+import signal
 import typer
 import json
 from typing import List, Optional
 from pathlib import Path
 
 # Import the core components from our existing application
-from .core.engine import ScrubberEngine
+from .core.engine import ScrubberEngine, PlaceholderMap
 from .core.registry import RecognizerRegistry
-from .models.data_models import ScrubTask
+from .core.structured import StructuredScrubber, split_lines
+from .models.data_models import ScrubTask, ScrubFormat, ScrubMode
 
 # Create a single Typer application instance
 app = typer.Typer(
@@ -40,6 +42,35 @@ def main(
     as_json: bool = typer.Option(
         False, "--json",
         help="Output the result as a JSON object with scrubbed text and legend."
+    ),
+    input_format: ScrubFormat = typer.Option(
+        ScrubFormat.TEXT, "--format",
+        help="Input format. Structured formats (json, jsonl, csv) only scrub string values and stream their output."
+    ),
+    fields: Optional[List[str]] = typer.Option(
+        None, "--field", "-f",
+        help="For structured formats, only scrub this JSON key or CSV column. Can be used multiple times."
+    ),
+    mode: ScrubMode = typer.Option(
+        ScrubMode.SCRUB, "--mode", "-m",
+        help="'detect' prints the PII spans and 'count' prints per-type counts as JSON, without scrubbing."
+    ),
+    limit: Optional[int] = typer.Option(
+        None, "--limit", min=1,
+        help="In detect/count mode, stop looking for a type after this many findings."
+    ),
+    first: bool = typer.Option(
+        False, "--first",
+        help="In detect/count mode, stop at the first finding of any type."
+    ),
+    follow: bool = typer.Option(
+        False, "--follow",
+        help="Scrub stdin line by line, flushing each line as it arrives (e.g. after 'tail -f'). "
+             "Send SIGUSR1 to print the legend to stderr; with --json it is also printed at the end."
+    ),
+    max_legend: int = typer.Option(
+        100_000, "--max-legend", min=1,
+        help="In follow mode, forget the least recently seen values beyond this many legend entries."
     )
 ):
     """
@@ -52,15 +83,11 @@ def main(
     if ctx.invoked_subcommand is not None:
         return
 
-    input_text = text
     # If no direct text argument, check for piped input from stdin
-    if input_text is None:
-        if not sys.stdin.isatty():
-            input_text = sys.stdin.read()
-        else:
-            # If no command is specified and no text is provided, show help.
-            typer.echo(ctx.get_help())
-            raise typer.Exit()
+    if text is None and sys.stdin.isatty():
+        # If no command is specified and no text is provided, show help.
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
 
     # If no types are specified, use all available recognizers
     scrub_types = types if types else list(REGISTRY_INSTANCE.recognizers.keys())
@@ -74,6 +101,27 @@ def main(
             typer.echo(f"Error: Allow list file not found at '{allow_list_file}'", err=True)
             raise typer.Exit(code=1)
 
+    if follow:
+        if text is not None or mode != ScrubMode.SCRUB or input_format == ScrubFormat.JSON:
+            typer.echo("Error: --follow reads text, jsonl or csv from stdin and only supports scrub mode.", err=True)
+            raise typer.Exit(code=1)
+        _follow(input_format, scrub_types, allow_list, fields, max_legend, as_json)
+        return
+
+    if mode != ScrubMode.SCRUB:
+        if input_format != ScrubFormat.TEXT:
+            typer.echo(f"Error: --mode {mode.value} only supports the text format.", err=True)
+            raise typer.Exit(code=1)
+        input_text = text if text is not None else sys.stdin.read()
+        _detect(input_text, mode, scrub_types, allow_list, limit, first)
+        return
+
+    if input_format != ScrubFormat.TEXT:
+        _scrub_structured(text, input_format, scrub_types, allow_list, fields, as_json)
+        return
+
+    input_text = text if text is not None else sys.stdin.read()
+
     # Perform the scrub operation
     task = ScrubTask(text=input_text, types=scrub_types, allow_list=allow_list)
     all_findings = REGISTRY_INSTANCE.get_findings(task.text, task.types)
@@ -90,6 +138,79 @@ def main(
         typer.echo(result.scrubbed_text)
 
 
+def _emit_legend(placeholders: PlaceholderMap):
+    sys.stderr.write(json.dumps({"legend": placeholders.legend()}) + "\n")
+    sys.stderr.flush()
+
+
+def _follow(input_format: ScrubFormat, scrub_types: List[str], allow_list: List[str],
+            fields: Optional[List[str]], max_legend: int, as_json: bool):
+    """
+    Scrubs a live stream one line (or record) at a time. Placeholders are kept
+    for the life of the process, bounded by `max_legend` entries.
+    """
+    placeholders = PlaceholderMap(max_entries=max_legend)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: _emit_legend(placeholders))
+
+    try:
+        if input_format == ScrubFormat.TEXT:
+            for line in sys.stdin:
+                findings = REGISTRY_INSTANCE.get_findings(line, scrub_types)
+                if findings:
+                    line = ENGINE_INSTANCE.scrub_fragment(line, findings, allow_list, placeholders)
+                sys.stdout.write(line)
+                sys.stdout.flush()
+        else:
+            scrubber = StructuredScrubber(ENGINE_INSTANCE, REGISTRY_INSTANCE, scrub_types, allow_list, fields,
+                                          placeholders)
+            for record in scrubber.iter_scrubbed(input_format, sys.stdin):
+                sys.stdout.write(record)
+                sys.stdout.flush()
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        pass
+    if as_json:
+        _emit_legend(placeholders)
+
+
+def _detect(input_text: str, mode: ScrubMode, scrub_types: List[str], allow_list: List[str],
+            limit: Optional[int], first: bool):
+    """Reports PII spans or counts without rewriting the text."""
+    task = ScrubTask(text=input_text, types=scrub_types, allow_list=allow_list)
+    findings = REGISTRY_INSTANCE.findings_by_type(task.text, task.types, task.allow_list)
+    if mode == ScrubMode.DETECT:
+        detected = ENGINE_INSTANCE.detect(task, findings, first, limit)
+        output = {"findings": [finding.to_dict() for finding in detected]}
+    else:
+        counts = ENGINE_INSTANCE.count(task, findings, first, limit)
+        output = {"counts": counts, "total": sum(counts.values())}
+    typer.echo(json.dumps(output, indent=2))
+
+
+def _scrub_structured(text: Optional[str], input_format: ScrubFormat, scrub_types: List[str],
+                      allow_list: List[str], fields: Optional[List[str]], as_json: bool):
+    """Streams structured input record by record, writing each as soon as it is scrubbed."""
+    scrubber = StructuredScrubber(ENGINE_INSTANCE, REGISTRY_INSTANCE, scrub_types, allow_list, fields)
+    lines = split_lines(text) if text is not None else sys.stdin
+    try:
+        if as_json:
+            scrubbed_text = "".join(scrubber.iter_scrubbed(input_format, lines))
+            output = {
+                "scrubbed_text": scrubbed_text,
+                "legend": scrubber.legend()
+            }
+            typer.echo(json.dumps(output, indent=2))
+        else:
+            for record in scrubber.iter_scrubbed(input_format, lines):
+                sys.stdout.write(record)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def types():
     """
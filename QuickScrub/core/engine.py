@@ -1,14 +1,121 @@
-from typing import List, Dict
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
 from ..models.data_models import ScrubTask, ScrubResult
 from ..recognizers.base import Finding
 
 
+class PlaceholderMap:
+    """
+    Assigns a stable placeholder (e.g. '[EMAIL_1]') to each distinct PII value
+    and records the legend. A single map can be shared across many calls so that
+    the same value always receives the same placeholder.
+
+    With `max_entries`, the least recently seen values are evicted once the map
+    is full, bounding memory for long-running streams. Numbers are never reused,
+    so an evicted value that shows up again simply gets a new placeholder.
+    """
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self.placeholder_counts: Dict[str, int] = {}
+        self.value_to_placeholder: "OrderedDict[str, str]" = OrderedDict()
+        self.legend_map: Dict[str, Dict[str, str]] = {}
+
+    def get(self, value: str, pii_type: str) -> str:
+        placeholder = self.value_to_placeholder.get(value)
+        if placeholder is None:
+            count = self.placeholder_counts.get(pii_type, 0) + 1
+            self.placeholder_counts[pii_type] = count
+            placeholder = f"[{pii_type}_{count}]"
+            self.value_to_placeholder[value] = placeholder
+            self.legend_map[placeholder] = {"original": value, "mock": placeholder, "type": pii_type}
+            if self.max_entries is not None and len(self.value_to_placeholder) > self.max_entries:
+                _, evicted = self.value_to_placeholder.popitem(last=False)
+                del self.legend_map[evicted]
+        elif self.max_entries is not None:
+            self.value_to_placeholder.move_to_end(value)
+        return placeholder
+
+    def legend(self) -> List[Dict[str, str]]:
+        return sorted(self.legend_map.values(), key=lambda item: int(item['mock'].split('_')[-1][:-1]))
+
+
 class ScrubberEngine:
-    def scrub(self, task: ScrubTask, findings: List[Finding]) -> ScrubResult:
+    def scrub(self, task: ScrubTask, findings: List[Finding],
+              placeholders: Optional[PlaceholderMap] = None) -> ScrubResult:
         final_findings = self._resolve_conflicts(findings, task.allow_list)
-        scrubbed_text, legend = self._scrub_text(task.text, final_findings)
+        scrubbed_text, legend = self._scrub_text(task.text, final_findings, placeholders)
         return ScrubResult(scrubbed_text=scrubbed_text, legend=legend)
 
+    def detect(self, task: ScrubTask, findings: Dict[str, Iterable[Finding]], first: bool = False,
+               limit: Optional[int] = None) -> List[Finding]:
+        """
+        Returns the non-overlapping findings without rewriting the text or building
+        a legend. `findings` maps each PII type to its (possibly lazy) findings,
+        which are consumed only as far as `first` or `limit` require.
+
+        `limit` caps the findings per type after overlaps are resolved, so a
+        finding swallowed by a longer one (e.g. an email inside a sensitive URL)
+        does not use up its type's quota. A type is scanned further only while
+        fewer than `limit` of its findings survive against everything scanned so far.
+        """
+        iterators = {pii_type: iter(items) for pii_type, items in findings.items()}
+        if first:
+            for items in iterators.values():
+                for finding in items:
+                    resolved = self._resolve_conflicts([finding], task.allow_list)
+                    if resolved:
+                        return resolved
+            return []
+        if limit is None:
+            return self._resolve_conflicts([f for items in iterators.values() for f in items], task.allow_list)
+
+        collected: Dict[str, List[Finding]] = {pii_type: [] for pii_type in iterators}
+        wanted = dict.fromkeys(iterators, limit)
+        while True:
+            for pii_type, items in iterators.items():
+                bucket = collected[pii_type]
+                bucket.extend(islice(items, wanted[pii_type] - len(bucket)))
+            resolved = self._resolve_conflicts([f for bucket in collected.values() for f in bucket],
+                                               task.allow_list)
+            kept = self._count_by_type(resolved)
+            # Types that filled their quota but lost findings to overlaps may have more to give.
+            short = [pii_type for pii_type, bucket in collected.items()
+                     if len(bucket) == wanted[pii_type] and kept.get(pii_type, 0) < limit]
+            if not short:
+                break
+            for pii_type in short:
+                wanted[pii_type] += limit - kept.get(pii_type, 0)
+
+        limited: List[Finding] = []
+        kept = {}
+        for finding in resolved:
+            if kept.get(finding.type, 0) < limit:
+                kept[finding.type] = kept.get(finding.type, 0) + 1
+                limited.append(finding)
+        return limited
+
+    def count(self, task: ScrubTask, findings: Dict[str, Iterable[Finding]], first: bool = False,
+              limit: Optional[int] = None) -> Dict[str, int]:
+        """Returns the number of non-overlapping findings per PII type."""
+        return self._count_by_type(self.detect(task, findings, first, limit))
+
+    @staticmethod
+    def _count_by_type(findings: List[Finding]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for finding in findings:
+            counts[finding.type] = counts.get(finding.type, 0) + 1
+        return counts
+
+    def scrub_fragment(self, text: str, findings: List[Finding], allow_list: List[str],
+                       placeholders: PlaceholderMap) -> str:
+        """
+        Scrubs one piece of a larger document (e.g. a single JSON value) against a
+        shared placeholder map. The legend is left in the map for the caller to collect.
+        """
+        final_findings = self._resolve_conflicts(findings, allow_list)
+        return self._replace_findings(text, final_findings, placeholders)
+
     def _resolve_conflicts(self, findings: List[Finding], allow_list: List[str]) -> List[Finding]:
         """
         Resolves overlapping findings and filters out values from the allow list.
@@ -39,26 +146,21 @@ class ScrubberEngine:
 
         return resolved
 
-    def _scrub_text(self, text: str, findings: List[Finding]) -> (str, List[Dict[str, str]]):
-        scrubbed_text = text
-        placeholder_counts: Dict[str, int] = {}
-        value_to_placeholder_map: Dict[str, str] = {}
-        legend_map: Dict[str, Dict[str, str]] = {}
+    def _scrub_text(self, text: str, findings: List[Finding],
+                    placeholders: Optional[PlaceholderMap] = None) -> (str, List[Dict[str, str]]):
+        # Without a shared map, numbering starts fresh for every call.
+        if placeholders is None:
+            placeholders = PlaceholderMap()
+        return self._replace_findings(text, findings, placeholders), placeholders.legend()
 
+    def _replace_findings(self, text: str, findings: List[Finding], placeholders: PlaceholderMap) -> str:
+        # This replacement logic operates on a clean, non-overlapping list of findings,
+        # so the output can be assembled in a single left-to-right pass.
+        parts: List[str] = []
+        last_end = 0
         for finding in sorted(findings, key=lambda f: f.start):
-            if finding.value in value_to_placeholder_map:
-                continue
-            pii_type = finding.type
-            count = placeholder_counts.get(pii_type, 0) + 1
-            placeholder_counts[pii_type] = count
-            placeholder = f"[{pii_type}_{count}]"
-            value_to_placeholder_map[finding.value] = placeholder
-            legend_map[placeholder] = {"original": finding.value, "mock": placeholder, "type": pii_type}
-
-        # This replacement logic now operates on a clean, non-overlapping list of findings.
-        for finding in reversed(findings):
-            placeholder = value_to_placeholder_map[finding.value]
-            scrubbed_text = scrubbed_text[:finding.start] + placeholder + scrubbed_text[finding.end:]
-
-        legend = sorted(legend_map.values(), key=lambda item: int(item['mock'].split('_')[-1][:-1]))
-        return scrubbed_text, legend
+            parts.append(text[last_end:finding.start])
+            parts.append(placeholders.get(finding.value, finding.type))
+            last_end = finding.end
+        parts.append(text[last_end:])
+        return "".join(parts)
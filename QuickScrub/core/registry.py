@@ -1,13 +1,102 @@
 import pkgutil
 import inspect
 import logging
-from typing import List, Dict
+from dataclasses import replace
+from typing import Dict, Iterator, List, Optional, Pattern, Set, Tuple, Union
 from ..recognizers.base import Recognizer, Finding
 from .. import recognizers as recognizers_package
 
+
+class TriggerIndex:
+    """
+    A cheap per-block summary of which triggers (substrings or compiled patterns,
+    see `Recognizer.TRIGGERS`) occur in a text, used to skip recognizers on blocks
+    where they cannot match. Blocks always end on a line boundary, so a match
+    that stays on one line never straddles two blocks. Matches that can span
+    lines (the label of a Markdown link) are handled by widening segments back
+    to an unclosed bracket, see `segments`.
+    """
+    def __init__(self, text: str, block_size: int):
+        self.text = text
+        self.blocks: List[Tuple[int, int]] = []
+        start = 0
+        while start < len(text):
+            end = text.find("\n", start + block_size)
+            end = len(text) if end == -1 else end + 1
+            self.blocks.append((start, end))
+            start = end
+        self._presence: Dict[Union[str, Pattern[str]], List[bool]] = {}
+
+    def _blocks_containing(self, trigger: Union[str, Pattern[str]]) -> List[bool]:
+        presence = self._presence.get(trigger)
+        if presence is None:
+            if isinstance(trigger, str):
+                find = self.text.find
+                presence = [find(trigger, start, end) != -1 for start, end in self.blocks]
+            else:
+                search = trigger.search
+                presence = [search(self.text, start, end) is not None for start, end in self.blocks]
+            self._presence[trigger] = presence
+        return presence
+
+    def segments(self, triggers: Tuple[Union[str, Pattern[str]], ...],
+                 brackets: Optional[Tuple[str, str]] = None) -> List[Tuple[int, int]]:
+        """
+        Returns the (start, end) spans of consecutive blocks containing any trigger.
+        With `brackets`, a segment that starts inside an unclosed opener is widened
+        back to the line holding that opener.
+        """
+        hits = [False] * len(self.blocks)
+        for trigger in triggers:
+            hits = [hit or present for hit, present in zip(hits, self._blocks_containing(trigger))]
+        segments: List[Tuple[int, int]] = []
+        for (start, end), hit in zip(self.blocks, hits):
+            if not hit:
+                continue
+            if segments and segments[-1][1] == start:
+                segments[-1] = (segments[-1][0], end)
+            else:
+                segments.append((start, end))
+        return self._widen(segments, *brackets) if brackets else segments
+
+    def _widen(self, segments: List[Tuple[int, int]], opener: str, closer: str) -> List[Tuple[int, int]]:
+        # Only the text after the previous segment's start is searched: an opener
+        # before it would already have widened that segment, so each character
+        # is looked at a bounded number of times.
+        text = self.text
+        widened: List[Tuple[int, int]] = []
+        lower = 0
+        for start, end in segments:
+            while True:
+                open_pos = text.rfind(opener, lower, start)
+                if open_pos == -1 or text.find(closer, open_pos, start) != -1:
+                    break
+                start = max(lower, text.rfind("\n", lower, open_pos) + 1)
+            if widened and start <= widened[-1][1]:
+                widened[-1] = (widened[-1][0], end)
+            else:
+                widened.append((start, end))
+            lower = widened[-1][0]
+        return widened
+
+
 class RecognizerRegistry:
+    # A small sample containing every supported PII type. Running it once forces
+    # lazily-loaded state (phonenumbers region metadata, the `re` module cache,
+    # ipaddress/urllib internals) to load before the first real request.
+    WARMUP_TEXT = (
+        "Contact admin@example.com or [Support](mailto:help@example.com) at (212) 555-0147.\n"
+        "Hosts 192.168.1.10, 2001:db8::8a2e:370:7334 and 00:1A:2B:3C:4D:5E. "
+        "Card 4111 1111 1111 1111. Reset at https://example.com/reset?token=abc123def456. "
+        "api_key = 'a_very_long_and_secure_key_123' and aT5vG7hJkLpW2sFqE9rY3zXcVbNmMpA8."
+    )
+    # Granularity of the trigger index. Smaller blocks skip more text on sparse
+    # input at the cost of more (cheap) substring searches.
+    BLOCK_SIZE = 4096
+
     def __init__(self):
         self.recognizers: Dict[str, Recognizer] = {}
+        self.ready = False
         self._discover_recognizers()
 
     def _discover_recognizers(self):
@@ -24,13 +113,55 @@ class RecognizerRegistry:
                 logging.error(f"Failed to load recognizer module {name}: {e}", exc_info=True)
         logging.info(f"Discovered recognizers: {list(self.recognizers.keys())}")
 
+    def warm_up(self):
+        """Runs every recognizer once so the first real request pays no loading cost."""
+        if self.ready:
+            return
+        self.get_findings(self.WARMUP_TEXT, list(self.recognizers.keys()))
+        self.ready = True
+        logging.info("Recognizer registry warmed up.")
+
     def get_findings(self, text: str, requested_types: List[str]) -> List[Finding]:
-        all_findings = []
-        for pii_type in requested_types:
-            if recognizer := self.recognizers.get(pii_type):
-                try:
-                    findings = recognizer.analyze(text)
-                    all_findings.extend(findings)
-                except Exception as e:
-                    logging.error(f"Error running recognizer '{recognizer.name}': {e}", exc_info=True)
-        return all_findings
+        return list(self.iter_findings(text, requested_types))
+
+    def _run_recognizer(self, recognizer: Recognizer, text: str,
+                        index: Optional[TriggerIndex]) -> Iterator[Finding]:
+        """Runs a gated recognizer only on the parts of the text that contain one of its triggers."""
+        if not recognizer.TRIGGERS:
+            yield from recognizer.iter_findings(text)
+            return
+        for start, end in index.segments(recognizer.TRIGGERS, recognizer.MULTILINE_BRACKETS):
+            if end - start == len(text):
+                yield from recognizer.iter_findings(text)
+                continue
+            for finding in recognizer.iter_findings(text[start:end]):
+                yield replace(finding, start=finding.start + start, end=finding.end + start)
+
+    def _iter_type(self, recognizer: Recognizer, text: str, index: Optional[TriggerIndex],
+                   allow_set: Optional[Set[str]]) -> Iterator[Finding]:
+        try:
+            for finding in self._run_recognizer(recognizer, text, index):
+                if allow_set and finding.value.lower() in allow_set:
+                    continue
+                yield finding
+        except Exception as e:
+            logging.error(f"Error running recognizer '{recognizer.name}': {e}", exc_info=True)
+
+    def findings_by_type(self, text: str, requested_types: List[str],
+                         allow_list: Optional[List[str]] = None) -> Dict[str, Iterator[Finding]]:
+        """
+        Returns a lazy iterator of findings for each requested type. Nothing is
+        scanned until an iterator is advanced, and each one can be advanced (or
+        abandoned) independently, so callers that only need to know whether (or
+        how much) PII is present can stop early. Allow-listed values are skipped.
+        """
+        allow_set = {item.lower() for item in allow_list} if allow_list else None
+        selected = [self.recognizers[pii_type] for pii_type in requested_types if pii_type in self.recognizers]
+        index = TriggerIndex(text, self.BLOCK_SIZE) if any(r.TRIGGERS for r in selected) else None
+        return {recognizer.tag: self._iter_type(recognizer, text, index, allow_set) for recognizer in selected}
+
+    def iter_findings(self, text: str, requested_types: List[str],
+                      allow_list: Optional[List[str]] = None) -> Iterator[Finding]:
+        """Lazily yields findings type by type."""
+        for findings in self.findings_by_type(text, requested_types, allow_list).values():
+            yield from findings
@@ -0,0 +1,133 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..models.data_models import ScrubFormat
+from ..recognizers.base import Finding
+from .engine import ScrubberEngine, PlaceholderMap
+from .registry import RecognizerRegistry
+
+
+def split_lines(text: str) -> Iterable[str]:
+    """
+    Splits a whole document into lines the way a file read from disk would be.
+    Unlike str.splitlines, this never splits on U+2028 and the other separators
+    that may legally appear unescaped inside a JSON string.
+    """
+    return io.StringIO(text, newline="")
+
+
+class StructuredScrubber:
+    """
+    Scrubs JSON, JSON-lines and CSV input without treating it as flat text.
+    Only string values (optionally restricted to selected keys or columns) are
+    run through the recognizers, so keys, numbers and quoting are never touched
+    and the output is always valid. Records are parsed and re-serialized one at
+    a time, and placeholders are shared across the whole stream.
+    """
+    # Repeated values (status strings, hostnames, user IDs...) are only run through
+    # the recognizers once. The findings are cached rather than the rendered
+    # output, so placeholders always come from the (possibly evicting) map.
+    CACHE_SIZE = 65536
+    MAX_CACHED_VALUE_LENGTH = 1024
+
+    def __init__(self, engine: ScrubberEngine, registry: RecognizerRegistry, types: List[str],
+                 allow_list: Optional[List[str]] = None, fields: Optional[List[str]] = None,
+                 placeholders: Optional[PlaceholderMap] = None):
+        self.engine = engine
+        self.registry = registry
+        self.types = types
+        self.allow_list = allow_list or []
+        self.fields = set(fields) if fields else None
+        self.placeholders = placeholders if placeholders is not None else PlaceholderMap()
+        self.cache_size = self.CACHE_SIZE
+        if self.placeholders.max_entries is not None:
+            self.cache_size = min(self.cache_size, self.placeholders.max_entries)
+        self._cache: Dict[str, List[Finding]] = {}
+
+    def legend(self) -> List[Dict[str, str]]:
+        return self.placeholders.legend()
+
+    def iter_scrubbed(self, fmt: ScrubFormat, lines: Iterable[str]) -> Iterator[str]:
+        """Dispatches to the scrubber for the given structured format."""
+        if fmt == ScrubFormat.JSONL:
+            return self.iter_jsonl(lines)
+        if fmt == ScrubFormat.CSV:
+            return self.iter_csv(lines)
+        if fmt == ScrubFormat.JSON:
+            return iter([self.scrub_json("".join(lines))])
+        raise ValueError(f"'{fmt.value}' is not a structured format.")
+
+    def scrub_value(self, value: str) -> str:
+        """Scrubs a single string value, reusing the findings for repeated values."""
+        findings = self._cache.get(value)
+        if findings is None:
+            findings = self.registry.get_findings(value, self.types)
+            if len(value) <= self.MAX_CACHED_VALUE_LENGTH:
+                if len(self._cache) >= self.cache_size:
+                    self._cache.clear()
+                self._cache[value] = findings
+        if not findings:
+            return value
+        return self.engine.scrub_fragment(value, findings, self.allow_list, self.placeholders)
+
+    def _scrub_node(self, node: Any, selected: bool) -> Any:
+        # A selected key selects its whole subtree.
+        if isinstance(node, str):
+            return self.scrub_value(node) if selected else node
+        if isinstance(node, dict):
+            return {key: self._scrub_node(value, selected or key in self.fields) for key, value in node.items()}
+        if isinstance(node, list):
+            return [self._scrub_node(item, selected) for item in node]
+        return node
+
+    def scrub_object(self, obj: Any) -> Any:
+        return self._scrub_node(obj, self.fields is None)
+
+    def scrub_json(self, text: str) -> str:
+        """Scrubs a single JSON document."""
+        try:
+            obj = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON at line {e.lineno}, column {e.colno}: {e.msg}") from e
+        return json.dumps(self.scrub_object(obj), ensure_ascii=False) + "\n"
+
+    def iter_jsonl(self, lines: Iterable[str]) -> Iterator[str]:
+        """Scrubs JSON-lines input, yielding one output line per input line."""
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                yield line
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number}: {e.msg}") from e
+            yield json.dumps(self.scrub_object(obj), ensure_ascii=False) + "\n"
+
+    def iter_csv(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Scrubs CSV input, yielding one output line per record. When fields are
+        given, the first row is treated as the header and only the named columns
+        are scrubbed; otherwise every cell is scrubbed.
+        """
+        reader = csv.reader(lines)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        selected_columns: Optional[set] = None
+        try:
+            for row in reader:
+                if self.fields is not None and selected_columns is None:
+                    selected_columns = {i for i, name in enumerate(row) if name in self.fields}
+                    out_row = row
+                elif selected_columns is None:
+                    out_row = [self.scrub_value(cell) for cell in row]
+                else:
+                    out_row = [self.scrub_value(cell) if i in selected_columns else cell
+                               for i, cell in enumerate(row)]
+                writer.writerow(out_row)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        except csv.Error as e:
+            raise ValueError(f"Invalid CSV on line {reader.line_num}: {e}") from e
@@ -0,0 +1,289 @@
+# FILE: QuickScrub/loadtest.py
+
+"""Local load-testing harness for the QuickScrub API.
+
+Starts the FastAPI app with uvicorn (or the pre-fork server) for each worker
+setting, replays a seeded mix of payload sizes and PII type selections built
+from the bundled test data at each concurrency level, and reports throughput,
+p50/p95/p99 latency and error rate. Results are written as JSON so that runs
+from different releases can be compared.
+
+Usage:
+    python -m QuickScrub.loadtest --workers 1 --workers 4 --concurrency 1 --concurrency 16
+"""
+
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import typer
+
+from .core.registry import RecognizerRegistry
+
+cli = typer.Typer(
+    name="quickscrub-loadtest",
+    help="Measure QuickScrub API throughput and latency under concurrency.",
+    add_completion=False,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# The test corpus lives in the source checkout; installed copies must pass --data.
+DEFAULT_DATA_FILES = [REPO_ROOT / "pii-test-data-ALL-DENSE.txt", REPO_ROOT / "pii-test-ALL-EXPANDED.md"]
+STARTUP_TIMEOUT = 30.0
+
+
+@dataclass
+class RunResult:
+    """Summary of one (workers, concurrency) combination."""
+    workers: int
+    concurrency: int
+    requests: int
+    errors: int
+    error_rate: float
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(workers: int, concurrency: int, latencies: List[float], errors: int, duration: float) -> RunResult:
+    ordered = sorted(latencies)
+    total = len(latencies)
+    return RunResult(
+        workers=workers,
+        concurrency=concurrency,
+        requests=total,
+        errors=errors,
+        error_rate=round(errors / total, 4) if total else 0.0,
+        duration_s=round(duration, 3),
+        throughput_rps=round(total / duration, 2) if duration else 0.0,
+        p50_ms=round(percentile(ordered, 50) * 1000, 2),
+        p95_ms=round(percentile(ordered, 95) * 1000, 2),
+        p99_ms=round(percentile(ordered, 99) * 1000, 2),
+        mean_ms=round(sum(ordered) / total * 1000, 2) if total else 0.0,
+        max_ms=round(ordered[-1] * 1000, 2) if total else 0.0,
+    )
+
+
+def build_payloads(data_files: List[Path], sizes_kb: List[int], count: int, seed: int,
+                   type_selections: Optional[List[List[str]]] = None) -> List[bytes]:
+    """
+    Builds `count` request bodies cycling through `sizes_kb`. Each body is a
+    random window of the test corpus. Bodies cycle through `type_selections`
+    when given; otherwise each asks for either all types or a random subset.
+    """
+    corpus = "\n".join(path.read_text(encoding="utf-8") for path in data_files)
+    all_types = sorted(RecognizerRegistry().recognizers.keys())
+    rng = random.Random(seed)
+    payloads = []
+    for i in range(count):
+        size = sizes_kb[i % len(sizes_kb)] * 1024
+        repeated = corpus * (size // len(corpus) + 2)
+        offset = rng.randrange(len(corpus))
+        if type_selections:
+            types = type_selections[i % len(type_selections)]
+        else:
+            types = all_types if rng.random() < 0.5 else rng.sample(all_types, rng.randint(1, 3))
+        payloads.append(json.dumps({"text": repeated[offset:offset + size], "types": types}).encode("utf-8"))
+    return payloads
+
+
+def _port_in_use(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+def _server_ready(port: int) -> bool:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+    try:
+        connection.request("GET", "/api/ready")
+        return connection.getresponse().status == 200
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        connection.close()
+
+
+def _start_server(server: str, workers: int, port: int) -> subprocess.Popen:
+    # Otherwise the readiness probe could be answered by whatever already holds
+    # the port, and the whole run would measure the wrong server.
+    if _port_in_use(port):
+        raise RuntimeError(f"Port {port} is already in use; pick a free one with --port.")
+    if server == "prefork":
+        command = [sys.executable, "-m", "QuickScrub.server", "--workers", str(workers), "--port", str(port)]
+    else:
+        command = [sys.executable, "-m", "uvicorn", "QuickScrub.main:app", "--port", str(port),
+                   "--workers", str(workers), "--log-level", "warning"]
+    process = subprocess.Popen(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited during startup: {' '.join(command)}")
+        if _server_ready(port):
+            return process
+        time.sleep(0.2)
+    _stop_server(process)
+    raise RuntimeError("Server did not become ready in time.")
+
+
+def _stop_server(process: subprocess.Popen):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _run_load(port: int, payloads: List[bytes], concurrency: int, total_requests: int):
+    latencies: List[float] = []
+    errors = 0
+    next_index = 0
+    lock = threading.Lock()
+
+    def worker():
+        nonlocal next_index, errors
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+        while True:
+            with lock:
+                if next_index >= total_requests:
+                    break
+                body = payloads[next_index % len(payloads)]
+                next_index += 1
+            start = time.perf_counter()
+            ok = False
+            try:
+                connection.request("POST", "/api/scrub", body, {"Content-Type": "application/json"})
+                response = connection.getresponse()
+                response.read()
+                ok = response.status == 200
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                if not ok:
+                    errors += 1
+        connection.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    return latencies, errors, time.perf_counter() - started
+
+
+@cli.command()
+def run(
+    workers: List[int] = typer.Option([1], "--workers", "-w", help="Server worker count. Can be used multiple times."),
+    concurrency: List[int] = typer.Option([1, 8], "--concurrency", "-c",
+                                          help="Concurrent clients. Can be used multiple times."),
+    requests: int = typer.Option(200, "--requests", "-n", min=1, help="Requests per (workers, concurrency) run."),
+    sizes_kb: List[int] = typer.Option([1, 16, 128], "--size-kb", "-s",
+                                       help="Payload size in KB to include in the mix. Can be used multiple times."),
+    server: str = typer.Option("uvicorn", help="'uvicorn' (uvicorn --workers) or 'prefork' (quickscrub-server)."),
+    port: int = typer.Option(8765, help="Local port for the server under test."),
+    seed: int = typer.Option(0, help="Seed for the payload mix, for repeatable runs."),
+    type_mix: Optional[List[str]] = typer.Option(
+        None, "--types", "-t",
+        help="Comma-separated PII types for one request selection, e.g. 'EMAIL,PHONE'. Can be used multiple "
+             "times; requests cycle through the selections. Default: a random mix of all and few types."),
+    data_files: Optional[List[Path]] = typer.Option(None, "--data", help="Text files to draw payloads from."),
+    output: Path = typer.Option(Path("loadtest-results.json"), "--output", "-o", help="Where to write the JSON results."),
+):
+    """
+    Run the load test for every combination of worker and concurrency settings.
+    """
+    if server not in ("uvicorn", "prefork"):
+        typer.echo("Error: --server must be 'uvicorn' or 'prefork'.", err=True)
+        raise typer.Exit(code=1)
+    data_files = data_files or DEFAULT_DATA_FILES
+    missing = [str(path) for path in data_files if not path.is_file()]
+    if missing:
+        typer.echo(f"Error: test data not found: {', '.join(missing)}. "
+                   f"Pass one or more text files with --data.", err=True)
+        raise typer.Exit(code=1)
+    type_selections = [[t.strip().upper() for t in selection.split(",") if t.strip()] for selection in type_mix or []]
+    known_types = set(RecognizerRegistry().recognizers)
+    unknown = sorted({t for selection in type_selections for t in selection} - known_types)
+    if unknown:
+        typer.echo(f"Error: unknown --types {', '.join(unknown)}. Available: {', '.join(sorted(known_types))}.",
+                   err=True)
+        raise typer.Exit(code=1)
+    if any(not selection for selection in type_selections):
+        typer.echo("Error: every --types selection needs at least one type.", err=True)
+        raise typer.Exit(code=1)
+    payloads = build_payloads(data_files, sizes_kb, max(requests, 64), seed, type_selections)
+
+    results: List[RunResult] = []
+    for worker_count in workers:
+        try:
+            process = _start_server(server, worker_count, port)
+        except RuntimeError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(code=1)
+        try:
+            # One untimed request per worker process so the measurement starts warm.
+            _run_load(port, payloads, worker_count, worker_count)
+            for clients in concurrency:
+                latencies, errors, duration = _run_load(port, payloads, clients, requests)
+                result = summarize(worker_count, clients, latencies, errors, duration)
+                results.append(result)
+                typer.echo(
+                    f"workers={result.workers:<3} concurrency={result.concurrency:<4} "
+                    f"rps={result.throughput_rps:<8} p50={result.p50_ms}ms p95={result.p95_ms}ms "
+                    f"p99={result.p99_ms}ms errors={result.error_rate:.2%}"
+                )
+        finally:
+            _stop_server(process)
+
+    report: Dict[str, object] = {
+        "quickscrub_version": _package_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cpu_count": os.cpu_count()},
+        "config": {"server": server, "requests": requests, "sizes_kb": sizes_kb, "seed": seed,
+                   "types": type_selections or "random"},
+        "results": [asdict(result) for result in results],
+    }
+    output.write_text(json.dumps(report, indent=2))
+    typer.echo(f"Results written to {output}")
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("QuickScrub")
+    except Exception:
+        return "unknown"
+
+
+if __name__ == "__main__":
+    cli()
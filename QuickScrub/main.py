@@ -1,14 +1,23 @@
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from .api import endpoints
+from .api.compression import CompressionMiddleware
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-app = FastAPI(title="QuickScrub API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # A no-op when the pre-fork server already warmed the registry in the parent.
+    endpoints.REGISTRY_INSTANCE.warm_up()
+    yield
 
+app = FastAPI(title="QuickScrub API", version="1.0.0", lifespan=lifespan)
+
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"]
@@ -1,12 +1,52 @@
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import List, Dict, Optional
 from pydantic import BaseModel, Field
 
+class ScrubFormat(str, Enum):
+    """The input formats understood by the scrubber."""
+    TEXT = "text"
+    JSON = "json"
+    JSONL = "jsonl"
+    CSV = "csv"
+
 class ScrubRequest(BaseModel):
     """The request model for the /api/scrub endpoint."""
     text: str = Field(..., description="The input text to be scrubbed.")
     types: List[str] = Field(..., description="A list of PII type tags to scrub (e.g., ['IP_ADDRESS', 'EMAIL']).")
     allow_list: Optional[List[str]] = Field(default_factory=list, description="A list of values to ignore during scrubbing.")
+    format: ScrubFormat = Field(ScrubFormat.TEXT, description="How to parse the input. Structured formats only scrub string values.")
+    fields: Optional[List[str]] = Field(None, description="For structured formats, only scrub these JSON keys or CSV columns.")
+
+class ScrubMode(str, Enum):
+    """What to produce: a scrubbed copy, the finding spans, or per-type counts."""
+    SCRUB = "scrub"
+    DETECT = "detect"
+    COUNT = "count"
+
+class DetectRequest(BaseModel):
+    """The request model for the /api/detect and /api/count endpoints."""
+    text: str = Field(..., description="The input text to analyze.")
+    types: List[str] = Field(..., description="A list of PII type tags to look for.")
+    allow_list: Optional[List[str]] = Field(default_factory=list, description="A list of values to ignore.")
+    limit: Optional[int] = Field(None, ge=1, description="Stop looking for a type after this many findings.")
+    first: bool = Field(False, description="Stop at the first finding of any type.")
+
+class FindingItem(BaseModel):
+    """A single PII span found in the input text."""
+    start: int
+    end: int
+    value: str
+    type: str
+
+class DetectResponse(BaseModel):
+    """The response model for the /api/detect endpoint."""
+    findings: List[FindingItem]
+
+class CountResponse(BaseModel):
+    """The response model for the /api/count endpoint."""
+    counts: Dict[str, int]
+    total: int
 
 class LegendItem(BaseModel):
     """Represents a single entry in the response legend."""
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple, Union
 
 @dataclass(frozen=True, order=True)
 class Finding:
@@ -15,8 +15,21 @@ class Finding:
     type: str
     recognizer_name: str
 
+    def to_dict(self) -> Dict[str, object]:
+        """The public view of a finding, as returned by detect mode."""
+        return {"start": self.start, "end": self.end, "value": self.value, "type": self.type}
+
 class Recognizer(ABC):
     """The abstract base class for all PII recognizer plugins."""
+    # Substrings (or compiled patterns) of which at least one must be present for
+    # this recognizer to possibly match (e.g. '@' for emails). The registry skips
+    # blocks of text that contain none of them. An empty tuple means "always run".
+    TRIGGERS: Tuple[Union[str, Pattern[str]], ...] = ()
+    # An (opener, closer) pair whose contents may span lines, such as the label
+    # of a Markdown link. Gated text is widened back to the line of an opener
+    # that is still unclosed, so such matches are never cut in half.
+    MULTILINE_BRACKETS: Optional[Tuple[str, str]] = None
+
     def __init__(self, name: str, tag: str):
         if not name or not tag:
             raise ValueError("Recognizer name and tag cannot be empty.")
@@ -28,5 +41,13 @@ class Recognizer(ABC):
         """Scans the input text and returns a list of all findings."""
         pass
 
+    def iter_findings(self, text: str) -> Iterator[Finding]:
+        """
+        Yields findings lazily, so callers that only need the first few can stop
+        scanning early. Recognizers that can produce findings incrementally
+        override this; the default simply runs `analyze`.
+        """
+        return iter(self.analyze(text))
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(name='{self.name}', tag='{self.tag}')>"
@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import Iterator, List
 from .base import Recognizer, Finding
 
 class CreditCardRecognizer(Recognizer):
@@ -7,6 +7,8 @@ class CreditCardRecognizer(Recognizer):
     # be interrupted by single spaces or dashes, but ensures it starts and ends
     # with a digit. This is a common pattern.
     CC_REGEX = re.compile(r'\b\d(?:[ -]?\d){12,18}\b')
+    # `\d` also matches non-ASCII digits, so the trigger must as well.
+    TRIGGERS = (re.compile(r"\d"),)
 
     def __init__(self):
         super().__init__(name="Credit Card", tag="CREDIT_CARD")
@@ -20,9 +22,10 @@ class CreditCardRecognizer(Recognizer):
             return False
 
     def analyze(self, text: str) -> List[Finding]:
-        findings = []
+        return list(self.iter_findings(text))
+
+    def iter_findings(self, text: str) -> Iterator[Finding]:
         for match in self.CC_REGEX.finditer(text):
             cc_digits = re.sub(r'\D', '', match.group(0))
             if 13 <= len(cc_digits) <= 19 and self._is_luhn_valid(cc_digits):
-                findings.append(Finding(match.start(), match.end(), match.group(0), self.tag, self.name))
-        return findings
+                yield Finding(match.start(), match.end(), match.group(0), self.tag, self.name)
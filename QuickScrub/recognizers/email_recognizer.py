@@ -5,6 +5,10 @@ from typing import List
 from .base import Recognizer, Finding
 
 class EmailRecognizer(Recognizer):
+    TRIGGERS = ("@",)
+    # The link text of a Markdown link may wrap across lines.
+    MULTILINE_BRACKETS = ("[", "]")
+
     # A simple regex to find a potential email address.
     BARE_EMAIL_REGEX = re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b')
 
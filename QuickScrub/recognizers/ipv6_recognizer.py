@@ -2,7 +2,7 @@
 
 import re
 import ipaddress
-from typing import List
+from typing import Iterator, List
 from .base import Recognizer, Finding
 
 class Ipv6Recognizer(Recognizer):
@@ -14,12 +14,15 @@ class Ipv6Recognizer(Recognizer):
     # could plausibly be an IPv6 address, including colons and hex characters.
     # The goal is to cast a wide net and let the ipaddress library do the real work.
     IPV6_CANDIDATE_REGEX = re.compile(r'\b([0-9a-fA-F:]+:+[0-9a-fA-F:]+)\b')
+    TRIGGERS = (":",)
 
     def __init__(self):
         super().__init__(name="IPv6 Address", tag="IPV6_ADDRESS")
 
     def analyze(self, text: str) -> List[Finding]:
-        findings = []
+        return list(self.iter_findings(text))
+
+    def iter_findings(self, text: str) -> Iterator[Finding]:
         for match in self.IPV6_CANDIDATE_REGEX.finditer(text):
             potential_ip = match.group(0)
             try:
@@ -27,14 +30,13 @@ class Ipv6Recognizer(Recognizer):
                 addr = ipaddress.ip_address(potential_ip)
                 # We only care about IPv6 addresses in this recognizer.
                 if addr.version == 6:
-                    findings.append(Finding(
+                    yield Finding(
                         start=match.start(),
                         end=match.end(),
                         value=potential_ip,
                         type=self.tag,
                         recognizer_name=self.name
-                    ))
+                    )
             except ValueError:
                 # This is expected for any candidate that isn't a valid IP address.
                 continue
-        return findings
@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import Iterator, List
 from .base import Recognizer, Finding
 
 
@@ -9,12 +9,16 @@ class MacAddressRecognizer(Recognizer):
         r'\b(?:[0-9A-Fa-f]{2}(?:\\?[:-])){5}(?:[0-9A-Fa-f]{2})\b|'
         r'\b(?:[0-9A-Fa-f]{4}(?:\\?\.|-)){2}(?:[0-9A-Fa-f]{4})\b'
     )
+    TRIGGERS = (":", "-", ".")
 
     def __init__(self):
         super().__init__(name="MAC Address", tag="MAC_ADDRESS")
 
     def analyze(self, text: str) -> List[Finding]:
-        return [
+        return list(self.iter_findings(text))
+
+    def iter_findings(self, text: str) -> Iterator[Finding]:
+        return (
             Finding(m.start(), m.end(), m.group(0), self.tag, self.name)
             for m in self.MAC_REGEX.finditer(text)
-        ]
+        )
@@ -12,7 +12,8 @@ The rest of the logic (digit‑count pre‑filter, span deduplication, line‑
 by‑line iteration) is unchanged, so no other recognizers are affected.
 """
 
-from typing import List
+import re
+from typing import Iterator, List
 
 import phonenumbers
 from phonenumbers import Leniency  # NEW – explicit import for clarity
@@ -23,6 +24,9 @@ from .base import Finding, Recognizer
 class PhoneRecognizer(Recognizer):
     """Recognize phone numbers using *phonenumbers* in POSSIBLE mode."""
 
+    # phonenumbers also accepts full-width and other non-ASCII digits.
+    TRIGGERS = (re.compile(r"\d"),)
+
     def __init__(self) -> None:
         super().__init__(name="Phone Number", tag="PHONE")
 
@@ -33,7 +37,11 @@ class PhoneRecognizer(Recognizer):
     def analyze(self, text: str) -> List[Finding]:
         """Return a list of phone‑number findings in *text*."""
 
-        findings: List[Finding] = []
+        return list(self.iter_findings(text))
+
+    def iter_findings(self, text: str) -> Iterator[Finding]:
+        """Yield phone‑number findings in *text*, one line at a time."""
+
         found_spans: set[tuple[int, int]] = set()  # avoid duplicates
         line_start_offset = 0  # running character offset while we iterate
 
@@ -62,16 +70,14 @@ class PhoneRecognizer(Recognizer):
                     if span in found_spans:
                         continue
 
-                    findings.append(
-                        Finding(
-                            start=abs_start,
-                            end=abs_end,
-                            value=match.raw_string,
-                            type=self.tag,
-                            recognizer_name=self.name,
-                        )
-                    )
                     found_spans.add(span)
+                    yield Finding(
+                        start=abs_start,
+                        end=abs_end,
+                        value=match.raw_string,
+                        type=self.tag,
+                        recognizer_name=self.name,
+                    )
             except Exception:
                 # The library occasionally raises on malformed fragments.
                 # We swallow the error because false negatives are better
@@ -79,5 +85,3 @@ class PhoneRecognizer(Recognizer):
                 pass
 
             line_start_offset += len(line)  # advance offset for next line
-
-        return findings
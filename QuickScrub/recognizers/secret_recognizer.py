@@ -2,7 +2,10 @@
 
 import re
 import math
-from typing import List, Set
+import string
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import List, Tuple
 from .base import Recognizer, Finding
 
 class SecretRecognizer(Recognizer):
@@ -34,6 +37,15 @@ class SecretRecognizer(Recognizer):
     GENERIC_REGEX = re.compile(r'\b[a-zA-Z0-9\-_/+.]{20,128}\b')
     ENTROPY_THRESHOLD = 3.5
 
+    # A string with k distinct characters has an entropy of at most log2(k), so
+    # anything with fewer distinct characters than this can never pass.
+    MIN_DISTINCT_CHARS = int(2 ** ENTROPY_THRESHOLD) + 1
+
+    # GENERIC_REGEX only matches ASCII, so these are the full character classes.
+    DIGITS = frozenset(string.digits)
+    LOWERCASE = frozenset(string.ascii_lowercase)
+    UPPERCASE = frozenset(string.ascii_uppercase)
+
     def __init__(self):
         super().__init__(name="API Keys & Secrets", tag="SECRET")
 
@@ -41,19 +53,45 @@ class SecretRecognizer(Recognizer):
         """Calculates the Shannon entropy of a string."""
         if not text:
             return 0.0
-        char_counts = {c: text.count(c) for c in set(text)}
-        entropy = -sum((count / len(text)) * math.log2(count / len(text)) for count in char_counts.values())
-        return entropy
+        length = len(text)
+        # Counter builds the histogram in a single pass.
+        return -sum((count / length) * math.log2(count / length) for count in Counter(text).values())
+
+    def _score_candidates(self, values: List[str]) -> List[bool]:
+        """
+        Decides which generic candidates are secrets. To qualify, a string must
+        have BOTH high character variety AND high entropy, which prevents flagging
+        long variable names or simple strings. One set() per candidate gives the
+        character classes and an upper bound on its entropy, so most non-secrets
+        are rejected before the histogram is built.
+        """
+        results = []
+        for value in values:
+            chars = set(value)
+            results.append(
+                len(chars) >= self.MIN_DISTINCT_CHARS
+                and not chars.isdisjoint(self.DIGITS)
+                and not chars.isdisjoint(self.LOWERCASE)
+                and not chars.isdisjoint(self.UPPERCASE)
+                and self._calculate_entropy(value) > self.ENTROPY_THRESHOLD
+            )
+        return results
+
+    @staticmethod
+    def _overlaps(spans: List[Tuple[int, int]], start: int, end: int) -> bool:
+        """Checks a (start, end) range against sorted, non-overlapping claimed spans."""
+        index = bisect_left(spans, (end,))
+        return index > 0 and spans[index - 1][1] > start
 
     def analyze(self, text: str) -> List[Finding]:
         findings = []
-        claimed_indices: Set[int] = set()
+        claimed_spans: List[Tuple[int, int]] = []
 
         # Pass 1: High-confidence prefixes (most reliable)
         for match in self.PREFIX_REGEX.finditer(text):
-            if not set(range(match.start(), match.end())).intersection(claimed_indices):
+            if not self._overlaps(claimed_spans, match.start(), match.end()):
                 findings.append(Finding(match.start(), match.end(), match.group(0), self.tag, self.name))
-                claimed_indices.update(range(match.start(), match.end()))
+                insort(claimed_spans, (match.start(), match.end()))
 
         # Pass 2: High-confidence keywords
         for match in self.KEYWORD_REGEX.finditer(text):
@@ -61,28 +99,20 @@ class SecretRecognizer(Recognizer):
             secret_val = match.group(2)
             start_pos = match.start(2)
             end_pos = match.end(2)
-            if not set(range(start_pos, end_pos)).intersection(claimed_indices):
+            if not self._overlaps(claimed_spans, start_pos, end_pos):
                 findings.append(Finding(start_pos, end_pos, secret_val, self.tag, self.name))
-                claimed_indices.update(range(start_pos, end_pos))
+                insort(claimed_spans, (start_pos, end_pos))
+
+        # Pass 3: Generic high-entropy strings (strictest filter). Generic matches
+        # never overlap each other, so only the earlier passes' claims matter, and
+        # the candidates can be scored as one batch.
+        candidates = [
+            match for match in self.GENERIC_REGEX.finditer(text)
+            if not self._overlaps(claimed_spans, match.start(), match.end())
+        ]
+        scores = self._score_candidates([match.group(0) for match in candidates])
+        for match, is_secret in zip(candidates, scores):
+            if is_secret:
+                findings.append(Finding(match.start(), match.end(), match.group(0), self.tag, self.name))
 
-        # Pass 3: Generic high-entropy strings (strictest filter)
-        for match in self.GENERIC_REGEX.finditer(text):
-            if set(range(match.start(), match.end())).intersection(claimed_indices):
-                continue
-            
-            value = match.group(0)
-            
-            # To qualify as a generic secret, a string must have BOTH high
-            # character variety AND high entropy. This prevents flagging
-            # long variable names or simple strings.
-            has_digit = any(c.isdigit() for c in value)
-            has_lower = any(c.islower() for c in value)
-            has_upper = any(c.isupper() for c in value)
-            
-            # Using 'and' is a critical change to reduce false positives.
-            if (has_digit and has_lower and has_upper) and self._calculate_entropy(value) > self.ENTROPY_THRESHOLD:
-                findings.append(Finding(match.start(), match.end(), value, self.tag, self.name))
-                # The claimed_indices logic is now correctly applied in all passes.
-                claimed_indices.update(range(match.start(), match.end()))
-        
-        return findings
\ No newline at end of file
+        return findings
@@ -18,6 +18,11 @@ class SensitiveUrlRecognizer(Recognizer):
     # Regex to find a Markdown link where the href part is a potentially sensitive URL.
     MARKDOWN_URL_REGEX = re.compile(r'(\[[^\]]*\]\(' + BARE_URL_REGEX.pattern + r'\))')
 
+    # A URL is only reported when it has a sensitive query parameter, so it
+    # cannot match without a '?'.
+    TRIGGERS = ("?",)
+    MULTILINE_BRACKETS = ("[", "]")
+
     SENSITIVE_KEYS: Set[str] = {
         'token', 'key', 'session', 'password', 'secret', 'apikey', 'auth',
         'access_token', 'session_id', 'session_key', 'auth_token', 'client_secret',
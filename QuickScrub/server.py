@@ -0,0 +1,127 @@
+# FILE: QuickScrub/server.py
+
+"""Pre-fork multi-worker server for the QuickScrub API.
+
+The parent process imports the application, discovers the recognizers and
+warms them up (compiled regexes, phonenumbers metadata, ...) exactly once.
+It then freezes the garbage collector so that everything allocated so far is
+moved out of the collector's reach, and forks the workers. Because the
+collector never touches those objects again, their memory pages stay shared
+copy-on-write between the workers instead of being duplicated N times.
+
+Usage:
+    python -m QuickScrub.server --workers 4 --host 0.0.0.0 --port 8000
+"""
+
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Set
+
+import typer
+import uvicorn
+
+cli = typer.Typer(
+    name="quickscrub-server",
+    help="Serve the QuickScrub API from a warmed, pre-forked pool of workers.",
+    add_completion=False,
+)
+
+# Seconds to wait before replacing a crashed worker, to avoid a tight crash loop.
+RESPAWN_DELAY = 1.0
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _spawn_worker(app, sock: socket.socket, host: str, port: int) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # --- Worker process ---
+    # Restore default signal handling; uvicorn installs its own handlers.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    gc.enable()
+    exit_code = 0
+    try:
+        config = uvicorn.Config(app, host=host, port=port, lifespan="on")
+        uvicorn.Server(config).run(sockets=[sock])
+    except Exception:
+        logging.exception("Worker %s crashed.", os.getpid())
+        exit_code = 1
+    finally:
+        # Never return into the parent's supervision loop.
+        os._exit(exit_code)
+
+
+@cli.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", help="Interface to bind to."),
+    port: int = typer.Option(8000, help="Port to bind to."),
+    workers: int = typer.Option(os.cpu_count() or 1, "--workers", "-w", min=1,
+                                help="Number of worker processes to fork."),
+):
+    """
+    Warm up the recognizers once, then fork WORKERS processes sharing them.
+    """
+    # Keep the collector from touching (and thereby un-sharing) objects while
+    # the shared state is being built.
+    gc.disable()
+
+    from .main import app
+    from .api.endpoints import REGISTRY_INSTANCE
+
+    REGISTRY_INSTANCE.warm_up()
+    sock = _bind_socket(host, port)
+
+    gc.collect()
+    gc.freeze()
+
+    children: Set[int] = set()
+    for _ in range(workers):
+        children.add(_spawn_worker(app, sock, host, port))
+    logging.info(f"Serving on http://{host}:{port} with {workers} pre-forked workers.")
+
+    stopping = False
+
+    def _shutdown(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if not stopping:
+            logging.warning(f"Worker {pid} exited unexpectedly (status {status}); restarting.")
+            time.sleep(RESPAWN_DELAY)
+            children.add(_spawn_worker(app, sock, host, port))
+
+    sock.close()
+    logging.info("All workers stopped.")
+
+
+if __name__ == "__main__":
+    cli()
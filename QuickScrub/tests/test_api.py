@@ -0,0 +1,112 @@
+import asyncio
+import gzip
+import json
+import unittest
+from fastapi.testclient import TestClient
+from ..main import app
+from ..api.compression import CompressionMiddleware, zstandard
+
+class TestScrubApi(unittest.TestCase):
+    """Integration tests for the HTTP API."""
+    @staticmethod
+    def make_echo_app(received):
+        async def echo_app(scope, receive, send):
+            received.append(await receive())
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+        return echo_app
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+        cls.client.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.__exit__(None, None, None)
+
+    def test_ready_after_startup(self):
+        response = self.client.get("/api/ready")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"ready": True})
+
+    def test_detect_and_count(self):
+        payload = {"text": "a@example.com b@example.com 10.0.0.1", "types": ["EMAIL", "IP_ADDRESS"], "limit": 1}
+        findings = self.client.post("/api/detect", json=payload).json()["findings"]
+        self.assertEqual(findings, [{"start": 0, "end": 13, "value": "a@example.com", "type": "EMAIL"},
+                                    {"start": 28, "end": 36, "value": "10.0.0.1", "type": "IP_ADDRESS"}])
+        counts = self.client.post("/api/count", json={**payload, "limit": None}).json()
+        self.assertEqual(counts, {"counts": {"EMAIL": 2, "IP_ADDRESS": 1}, "total": 3})
+
+    def test_gzip_request_and_response(self):
+        payload = {"text": "Mail admin@example.com. " * 200, "types": ["EMAIL"]}
+        body = gzip.compress(json.dumps(payload).encode())
+        response = self.client.post(
+            "/api/scrub", content=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip", "Accept-Encoding": "gzip"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        data = response.json()
+        self.assertEqual(data["scrubbed_text"], "Mail [EMAIL_1]. " * 200)
+        self.assertEqual(data["legend"], [{"original": "admin@example.com", "mock": "[EMAIL_1]", "type": "EMAIL"}])
+
+    def test_rejects_bad_encodings(self):
+        response = self.client.post("/api/scrub", content=b"not gzip",
+                                    headers={"Content-Type": "application/json", "Content-Encoding": "gzip"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post("/api/scrub", content=b"{}",
+                                    headers={"Content-Type": "application/json", "Content-Encoding": "br"})
+        self.assertEqual(response.status_code, 415)
+
+    def test_decompressed_size_limit(self):
+        received = []
+        echo_app = self.make_echo_app(received)
+        client = TestClient(CompressionMiddleware(echo_app, max_body_size=1000))
+        bomb = gzip.compress(b"0" * 100_000)
+        response = client.post("/", content=bomb, headers={"Content-Encoding": "gzip"})
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(received, [])
+        response = client.post("/", content=gzip.compress(b"0" * 1000), headers={"Content-Encoding": "gzip"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(received[0]["body"], b"0" * 1000)
+
+    def test_multi_member_gzip_and_truncation(self):
+        received = []
+        client = TestClient(CompressionMiddleware(self.make_echo_app(received)))
+        body = gzip.compress(b"first ") + gzip.compress(b"second")
+        response = client.post("/", content=body, headers={"Content-Encoding": "gzip"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(received[0]["body"], b"first second")
+        response = client.post("/", content=body[:-4], headers={"Content-Encoding": "gzip"})
+        self.assertEqual(response.status_code, 400)
+        if zstandard is None:
+            return
+        compressor = zstandard.ZstdCompressor()
+        body = compressor.compress(b"first ") + compressor.compress(b"second" * 1000)
+        response = client.post("/", content=body, headers={"Content-Encoding": "zstd"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(received[-1]["body"], b"first " + b"second" * 1000)
+        for cut in (4, len(body) // 2, len(body) - 1):
+            response = client.post("/", content=body[:cut], headers={"Content-Encoding": "zstd"})
+            self.assertEqual(response.status_code, 400)
+
+    def test_oversized_body_is_rejected_while_streaming(self):
+        bomb = gzip.compress(b"0" * 1_000_000)
+        chunks = [bomb[i:i + 64] for i in range(0, len(bomb), 64)]
+        sent, statuses = [], []
+
+        async def receive():
+            sent.append(chunks[len(sent)])
+            return {"type": "http.request", "body": sent[-1], "more_body": len(sent) < len(chunks)}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        middleware = CompressionMiddleware(self.make_echo_app([]), max_body_size=10_000)
+        scope = {"type": "http", "headers": [(b"content-encoding", b"gzip")]}
+        asyncio.run(middleware(scope, receive, send))
+        self.assertEqual(statuses, [413])
+        # Decoding stopped long before the whole compressed body was read.
+        self.assertLess(len(sent), len(chunks) // 2)
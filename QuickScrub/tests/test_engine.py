@@ -1,5 +1,5 @@
 import unittest
-from ..core.engine import ScrubberEngine
+from ..core.engine import ScrubberEngine, PlaceholderMap
 from ..recognizers.base import Finding
 from ..models.data_models import ScrubTask
 
@@ -15,3 +15,15 @@ class TestScrubberEngine(unittest.TestCase):
         text = "IP 1.1.1.1 and email test@dev.com."; findings = [Finding(3,10,"1.1.1.1","IP","IP"), Finding(21,35,"test@dev.com","EMAIL","Email")]
         task = ScrubTask(text=text, types=["IP", "EMAIL"]); result = self.engine.scrub(task, findings)
         self.assertEqual(result.scrubbed_text, "IP [IP_1] and email [EMAIL_1]."); self.assertEqual(len(result.legend), 2)
+    def test_detect_and_count(self):
+        findings = [Finding(0,3,"foo","T1","R1"), Finding(1,2,"o","T2","R2"), Finding(4,7,"bar","T1","R1")]; task = ScrubTask(text="foo bar", types=["T1", "T2"])
+        sources = lambda: {"T1": iter([findings[0], findings[2]]), "T2": iter([findings[1]])}
+        self.assertEqual([f.value for f in self.engine.detect(task, sources())], ["foo", "bar"]); self.assertEqual(self.engine.count(task, sources()), {"T1": 2})
+        self.assertEqual(self.engine.detect(task, sources(), first=True), [findings[0]])
+    def test_limit_applies_after_overlaps(self):
+        short = [Finding(1,2,"o","T2","R2"), Finding(8,9,"x","T2","R2"), Finding(10,11,"y","T2","R2")]
+        sources = {"T2": iter(short), "T1": iter([Finding(0,3,"foo","T1","R1")])}; task = ScrubTask(text="foo bar x y", types=["T1", "T2"])
+        self.assertEqual([f.value for f in self.engine.detect(task, sources, limit=1)], ["foo", "x"]); self.assertEqual(next(sources["T2"]).value, "y")
+    def test_placeholder_map_evicts_least_recent(self):
+        placeholders = PlaceholderMap(max_entries=2); placeholders.get("a", "T"); placeholders.get("b", "T"); placeholders.get("a", "T"); placeholders.get("c", "T")
+        self.assertEqual([item["original"] for item in placeholders.legend()], ["a", "c"]); self.assertEqual(placeholders.get("b", "T"), "[T_4]")
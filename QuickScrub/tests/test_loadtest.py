@@ -0,0 +1,45 @@
+import json
+import socket
+import unittest
+from pathlib import Path
+from typer.testing import CliRunner
+from ..loadtest import cli, percentile, summarize, build_payloads, DEFAULT_DATA_FILES, _start_server
+
+class TestLoadTestHarness(unittest.TestCase):
+    """Unit tests for the load-test statistics and payload mix."""
+    def test_percentiles(self):
+        values = [i / 1000 for i in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 0.05)
+        self.assertEqual(percentile(values, 99), 0.099)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_summarize(self):
+        result = summarize(2, 4, [0.01, 0.02, 0.03, 0.04], errors=1, duration=2.0)
+        self.assertEqual(result.throughput_rps, 2.0)
+        self.assertEqual(result.error_rate, 0.25)
+        self.assertEqual(result.p50_ms, 20.0)
+
+    def test_payload_mix_is_repeatable(self):
+        first = build_payloads(DEFAULT_DATA_FILES, [1, 4], 6, seed=7)
+        self.assertEqual(first, build_payloads(DEFAULT_DATA_FILES, [1, 4], 6, seed=7))
+        self.assertEqual(len(first), 6)
+
+    def test_missing_data_files_are_reported(self):
+        result = CliRunner().invoke(cli, ["--data", str(Path(__file__).parent / "no-such-corpus.txt")])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("--data", result.output)
+
+    def test_refuses_port_already_in_use(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            sock.listen(1)
+            with self.assertRaises(RuntimeError):
+                _start_server("uvicorn", 1, sock.getsockname()[1])
+
+    def test_type_selections_cycle(self):
+        payloads = build_payloads(DEFAULT_DATA_FILES, [1], 4, seed=0, type_selections=[["EMAIL"], ["PHONE", "IP_ADDRESS"]])
+        self.assertEqual([json.loads(p)["types"] for p in payloads],
+                         [["EMAIL"], ["PHONE", "IP_ADDRESS"], ["EMAIL"], ["PHONE", "IP_ADDRESS"]])
+        result = CliRunner().invoke(cli, ["--types", "EMAIL,NOPE"])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("NOPE", result.output)
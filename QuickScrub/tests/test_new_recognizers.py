@@ -1,3 +1,4 @@
+import math
 import unittest
 from QuickScrub.recognizers.secret_recognizer import SecretRecognizer
 from QuickScrub.recognizers.ipv6_recognizer import Ipv6Recognizer
@@ -25,6 +26,21 @@ class TestNewRecognizers(unittest.TestCase):
         self.assertIn("a_very_long_and_secure_key_123", values)
         self.assertIn("aT5vG7hJkLpW2sFqE9rY3zXcVbNmMpA8", values)
 
+    def test_secret_candidate_scoring(self):
+        recognizer = SecretRecognizer()
+        candidates = [
+            "aT5vG7hJkLpW2sFqE9rY3zXcVbNmMpA8",          # mixed classes, high entropy
+            "e3b0c44298fc1c149afbf4c8996fb92427ae41e4",  # hex: no uppercase
+            "aaaaBBBB1111aaaaBBBB1111",                  # too few distinct characters
+            "some_long_variable_name_here",             # no digits or uppercase
+        ]
+        self.assertEqual(recognizer._score_candidates(candidates), [True, False, False, False])
+        for value in candidates:
+            self.assertAlmostEqual(
+                recognizer._calculate_entropy(value),
+                -sum(value.count(c) / len(value) * math.log2(value.count(c) / len(value)) for c in set(value))
+            )
+
     def test_ipv6_recognizer(self):
         recognizer = Ipv6Recognizer()
         text = (
@@ -0,0 +1,69 @@
+import unittest
+from ..core.engine import ScrubberEngine
+from ..core.registry import RecognizerRegistry, TriggerIndex
+from ..models.data_models import ScrubTask
+
+class TestRecognizerRegistry(unittest.TestCase):
+    """Unit tests for recognizer discovery and warm-up."""
+    def test_warm_up_marks_registry_ready(self):
+        registry = RecognizerRegistry()
+        self.assertFalse(registry.ready)
+        registry.warm_up()
+        self.assertTrue(registry.ready)
+
+    def test_warmup_text_exercises_every_recognizer(self):
+        registry = RecognizerRegistry()
+        found_types = {f.type for f in registry.get_findings(registry.WARMUP_TEXT, list(registry.recognizers))}
+        self.assertEqual(found_types, set(registry.recognizers))
+
+    def test_iter_findings_allow_list(self):
+        registry = RecognizerRegistry()
+        text = "Hosts 10.0.0.1, 10.0.0.2 and 10.0.0.3 mailed a@example.com"
+        findings = list(registry.iter_findings(text, ["IP_ADDRESS", "EMAIL"], allow_list=["10.0.0.1"]))
+        self.assertEqual([f.value for f in findings], ["10.0.0.2", "10.0.0.3", "a@example.com"])
+
+    def test_limit_skips_findings_swallowed_by_longer_spans(self):
+        registry, engine = RecognizerRegistry(), ScrubberEngine()
+        text = "see https://x.com/r?token=abc&u=c@d.com then e@f.com"
+        task = ScrubTask(text=text, types=["SENSITIVE_URL", "EMAIL"])
+        counts = engine.count(task, registry.findings_by_type(text, task.types), limit=1)
+        self.assertEqual(counts, {"SENSITIVE_URL": 1, "EMAIL": 1})
+        detected = engine.detect(task, registry.findings_by_type(text, task.types), limit=1)
+        self.assertEqual([f.value for f in detected if f.type == "EMAIL"], ["e@f.com"])
+
+    def test_trigger_index_segments(self):
+        text = "plain line\n" * 10 + "mail a@b.com\n" + "plain line\n" * 10
+        index = TriggerIndex(text, block_size=20)
+        segments = index.segments(("@",))
+        self.assertEqual(len(segments), 1)
+        start, end = segments[0]
+        self.assertIn("a@b.com", text[start:end])
+        self.assertLess(end - start, 60)
+        self.assertEqual(index.segments(("#",)), [])
+
+    def test_gating_matches_ungated_results(self):
+        registry = RecognizerRegistry()
+        registry.BLOCK_SIZE = 64
+        text = ("filler text without anything\n" * 5 + registry.WARMUP_TEXT + "\n") * 3
+        expected = sorted(f for recognizer in registry.recognizers.values() for f in recognizer.analyze(text))
+        self.assertEqual(sorted(registry.get_findings(text, list(registry.recognizers))), expected)
+
+    def test_gating_keeps_non_ascii_digits(self):
+        registry = RecognizerRegistry()
+        registry.BLOCK_SIZE = 16
+        cases = {"CREDIT_CARD": "pay with ٤١١١ ١١١١ ١١١١ ١١١١ now", "PHONE": "call ２١٢-٥٥٥-٠١٤٧"}
+        for pii_type, line in cases.items():
+            text = "filler text without anything\n" * 3 + line + "\n"
+            expected = sorted(registry.recognizers[pii_type].analyze(text))
+            self.assertTrue(expected)
+            self.assertEqual(sorted(registry.get_findings(text, [pii_type])), expected)
+
+    def test_gating_keeps_markdown_links_that_span_blocks(self):
+        registry = RecognizerRegistry()
+        registry.BLOCK_SIZE = 16
+        text = ("x" * 20 + "\n[contact support here\n" + "y" * 20 + "\n more](mailto:a@b.com)\n"
+                + "z" * 20 + "\n[reset\n" + "w" * 20 + "\n link](https://x.com/r?token=abc)\n")
+        for pii_type in ("EMAIL", "SENSITIVE_URL"):
+            expected = sorted(registry.recognizers[pii_type].analyze(text))
+            self.assertEqual(sorted(registry.get_findings(text, [pii_type])), expected)
+        self.assertEqual(registry.get_findings(text, ["EMAIL"])[0].start, 21)
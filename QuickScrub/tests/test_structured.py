@@ -0,0 +1,65 @@
+import json
+import unittest
+from ..core.engine import ScrubberEngine, PlaceholderMap
+from ..core.registry import RecognizerRegistry
+from ..core.structured import StructuredScrubber, split_lines
+from ..models.data_models import ScrubFormat
+
+class TestStructuredScrubber(unittest.TestCase):
+    """Unit tests for the JSON, JSON-lines and CSV scrubbing modes."""
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = ScrubberEngine()
+        cls.registry = RecognizerRegistry()
+
+    def make_scrubber(self, fields=None, allow_list=None):
+        return StructuredScrubber(self.engine, self.registry, ["EMAIL", "IP_ADDRESS"], allow_list, fields)
+
+    def test_jsonl_scrubs_only_string_values(self):
+        scrubber = self.make_scrubber()
+        lines = ['{"user": "bob@example.com", "count": 10, "note": "say \\"hi\\" to bob@example.com"}\n',
+                 '{"bob@example.com": "10.0.0.1"}\n']
+        output = list(scrubber.iter_scrubbed(ScrubFormat.JSONL, lines))
+        self.assertEqual(len(output), 2)
+        first, second = (json.loads(line) for line in output)
+        self.assertEqual(first, {"user": "[EMAIL_1]", "count": 10, "note": 'say "hi" to [EMAIL_1]'})
+        # Keys are never scanned.
+        self.assertEqual(second, {"bob@example.com": "[IP_ADDRESS_1]"})
+        self.assertEqual(len(scrubber.legend()), 2)
+
+    def test_json_fields_select_subtrees(self):
+        scrubber = self.make_scrubber(fields=["meta"])
+        text = '{"email": "a@b.com", "meta": {"hosts": ["10.0.0.1", "a@b.com"]}}'
+        result = json.loads(scrubber.scrub_json(text))
+        self.assertEqual(result["email"], "a@b.com")
+        self.assertEqual(result["meta"]["hosts"], ["[IP_ADDRESS_1]", "[EMAIL_1]"])
+
+    def test_csv_columns_and_quoting(self):
+        scrubber = self.make_scrubber(fields=["email"])
+        lines = ["name,email,ip\n", '"Doe, Jane",jane@corp.com,10.1.1.1\n']
+        output = "".join(scrubber.iter_scrubbed(ScrubFormat.CSV, lines))
+        self.assertEqual(output, 'name,email,ip\n"Doe, Jane",[EMAIL_1],10.1.1.1\n')
+
+    def test_allow_list_and_invalid_input(self):
+        scrubber = self.make_scrubber(allow_list=["10.0.0.1"])
+        self.assertEqual(scrubber.scrub_value("ip 10.0.0.1"), "ip 10.0.0.1")
+        with self.assertRaises(ValueError):
+            list(scrubber.iter_jsonl(['{"a": 1}\n', '{"a":\n']))
+
+    def test_jsonl_keeps_unicode_line_separators_inside_strings(self):
+        scrubber = self.make_scrubber()
+        text = '{"msg": "a\u2028b x@y.com"}\n{"msg": "c\x85d"}\n'
+        output = "".join(scrubber.iter_scrubbed(ScrubFormat.JSONL, split_lines(text)))
+        self.assertEqual(output, '{"msg": "a\u2028b [EMAIL_1]"}\n{"msg": "c\x85d"}\n')
+
+    def test_repeated_values_follow_placeholder_eviction(self):
+        placeholders = PlaceholderMap(max_entries=2)
+        scrubber = StructuredScrubber(self.engine, self.registry, ["EMAIL"], placeholders=placeholders)
+        values = ["a@x.com", "b@x.com", "a@x.com", "c@x.com", "a@x.com", "hi a@x.com"]
+        lines = [json.dumps({"v": value}) + "\n" for value in values]
+        output = [json.loads(line)["v"] for line in scrubber.iter_scrubbed(ScrubFormat.JSONL, lines)]
+        self.assertEqual(output, ["[EMAIL_1]", "[EMAIL_2]", "[EMAIL_1]", "[EMAIL_3]", "[EMAIL_1]", "hi [EMAIL_1]"])
+        # b was evicted; every placeholder still in use is in the legend.
+        legend = {item["mock"]: item["original"] for item in scrubber.legend()}
+        self.assertEqual(legend, {"[EMAIL_1]": "a@x.com", "[EMAIL_3]": "c@x.com"})
+        self.assertEqual(scrubber.cache_size, 2)